@@ -1 +1,7 @@
+import os
+
+
+os.environ.setdefault('OAUTHLIB_RELAX_TOKEN_SCOPE', '1')
+os.environ.setdefault('OAUTHLIB_IGNORE_SCOPE_CHANGE', '1')
+
 from .client import TaskList, Task, ToDoConnection, TaskStatusFilter, PymstodoError
@@ -0,0 +1,283 @@
+import asyncio
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+from .client import PymstodoError, Task, TaskList, TaskStatusFilter, Token, _Connection, _dumps, _loads
+
+
+class AsyncToDoConnection(_Connection):
+    '''**Asynchronous To-Do connection** mirrors `ToDoConnection` with awaitable methods
+
+    Requests share one HTTP/2 connection, so calls gathered with `asyncio.gather` are multiplexed.
+    Requires `httpx` with HTTP/2 support: `pip3 install pymstodo[async]`.
+
+    Args:
+        client_id: API client ID
+        client_secret: API client secret
+        token: Token obtained by method `ToDoConnection.get_token`
+    '''
+
+    def __init__(self, client_id: str, client_secret: str, token: Token) -> None:
+        super().__init__(client_id, client_secret, token)
+        self._client: httpx.AsyncClient = httpx.AsyncClient(
+            http2=True,
+            headers={'Authorization': self._auth_header},
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+
+    async def aclose(self) -> None:
+        '''Close the underlying HTTP connections'''
+        await self._client.aclose()
+
+    async def _refresh_token(self) -> None:
+        if self._token_expired():
+            await asyncio.to_thread(self._renew_token)
+        # follows both a renewal and a token assigned by the caller
+        self._client.headers['Authorization'] = self._auth_header
+
+    async def _request(self, method: str, url: str, json: dict[str, Any] | None = None) -> httpx.Response:
+        await self._refresh_token()
+        if json is None:
+            resp = await self._client.request(method, url)
+        else:
+            resp = await self._client.request(method, url, content=_dumps(json), headers=AsyncToDoConnection._json_headers)
+        if not resp.is_success:
+            raise PymstodoError(resp.status_code, resp.reason_phrase)
+
+        return resp
+
+    async def _batch(self, method: str, items: Sequence[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        results: list[Any] = []
+        for batch_requests in AsyncToDoConnection._batch_requests(method, items):
+            resp = await self._request('POST', AsyncToDoConnection._batch_url, json={'requests': batch_requests})
+            results.extend(AsyncToDoConnection._batch_results(_loads(resp.content)['responses']))
+
+        return results
+
+    async def get_lists(self, limit: int | None = 99) -> list[TaskList]:
+        '''Get a list of the task lists
+
+        Args:
+            limit: The limit size of the response
+
+        Returns:
+            A list of the task lists
+
+        Raises:
+            PymstodoError: An error occurred accessing the API
+        '''
+        resp = await self._request('GET', f'{AsyncToDoConnection._lists_url}?$top={limit}')
+        contents = _loads(resp.content)['value']
+        return [TaskList.from_dict(list_data) for list_data in contents]
+
+    async def create_list(self, name: str) -> TaskList:
+        '''Create a new task list
+
+        Args:
+            name: Title of the new task list
+
+        Returns:
+            A created task list
+
+        Raises:
+            PymstodoError: An error occurred accessing the API
+        '''
+        resp = await self._request('POST', AsyncToDoConnection._lists_url, json={'displayName': name})
+        return TaskList.from_dict(_loads(resp.content))
+
+    async def get_list(self, list_id: str) -> TaskList:
+        '''Read the properties of a task list
+
+        Args:
+            list_id: Unique identifier for the task list
+
+        Returns:
+            A task list object
+
+        Raises:
+            PymstodoError: An error occurred accessing the API
+        '''
+        resp = await self._request('GET', AsyncToDoConnection._list_url(list_id))
+        return TaskList.from_dict(_loads(resp.content))
+
+    async def update_list(self, list_id: str, **list_data: str | bool) -> TaskList:
+        '''Update the properties of a task list
+
+        Args:
+            list_id: Unique identifier for the task list
+            list_data: Task properties from `TaskList` object
+
+        Returns:
+            An updated task list.
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        resp = await self._request('PATCH', AsyncToDoConnection._list_url(list_id), json=list_data)
+        return TaskList.from_dict(_loads(resp.content))
+
+    async def delete_list(self, list_id: str) -> bool:
+        '''Delete a task list
+
+        Args:
+            list_id: Unique identifier for the task list
+
+        Returns:
+            `True` if success
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        await self._request('DELETE', AsyncToDoConnection._list_url(list_id))
+        return True
+
+    async def get_tasks(self, list_id: str, limit: int | None = 1000, status: TaskStatusFilter | None = TaskStatusFilter.NOT_COMPLETED, fields: Iterable[str] | None = None) -> list[Task]:
+        '''Get tasks by a specified task list
+
+        Args:
+            list_id: Unique identifier for the task list
+            limit: The limit size of the response
+            status: The state or progress of the task
+            fields: Task properties to request, e.g. `('title', 'status', 'dueDateTime')` or a single `'title'`;
+                all properties if not set. Properties left out are `None` in the returned tasks
+
+        Returns:
+            Tasks of a specified task list
+
+        Raises:
+            PymstodoError: An error occurred accessing the API
+        '''
+        eff_limit = limit or 1000
+        url: str | None = AsyncToDoConnection._get_tasks_url(list_id, eff_limit, status, fields)
+        tasks: list[Task] = []
+        while url and len(tasks) < eff_limit:
+            resp = await self._request('GET', url)
+            page = _loads(resp.content)
+            url = page.get('@odata.nextLink')
+            tasks.extend(Task.from_dict(task_data) for task_data in page['value'])
+        if limit and len(tasks) > limit:
+            del tasks[limit:]
+        return tasks
+
+    async def create_task(self, title: str, list_id: str, due_date: datetime | None = None, body_text: str | None = None) -> Task:
+        '''Create a new task in a specified task list
+
+        Args:
+            title: A brief description of the task
+            list_id: Unique identifier for the task list
+            due_date: The date and time that the task is to be finished
+            body_text: Information about the task
+
+        Returns:
+            A created task
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        task_data = AsyncToDoConnection._new_task_data(title, due_date, body_text)
+        resp = await self._request('POST', AsyncToDoConnection._tasks_url(list_id), json=task_data)
+        return Task.from_dict(_loads(resp.content))
+
+    async def get_task(self, task_id: str, list_id: str) -> Task:
+        '''Read the properties of a task
+
+        Args:
+            task_id: Unique identifier for the task
+            list_id: Unique identifier for the task list
+
+        Returns:
+            A task object
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        resp = await self._request('GET', AsyncToDoConnection._task_url(list_id, task_id))
+        return Task.from_dict(_loads(resp.content))
+
+    async def update_task(self, task_id: str, list_id: str, **task_data: str | int | bool) -> Task:
+        '''Update the properties of a task
+
+        Args:
+            task_id: Unique identifier for the task
+            list_id: Unique identifier for the task list
+            task_data: Task properties from `Task` object
+
+        Returns:
+            An updated task
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        resp = await self._request('PATCH', AsyncToDoConnection._task_url(list_id, task_id), json=task_data)
+        return Task.from_dict(_loads(resp.content))
+
+    async def delete_task(self, task_id: str, list_id: str) -> bool:
+        '''Delete a task
+
+        Args:
+            task_id: Unique identifier for the task
+            list_id: Unique identifier for the task list
+
+        Returns:
+            `True` if success
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        await self._request('DELETE', AsyncToDoConnection._task_url(list_id, task_id))
+        return True
+
+    async def complete_task(self, task_id: str, list_id: str) -> Task:
+        '''Complete a task
+
+        Args:
+            task_id: Unique identifier for the task
+            list_id: Unique identifier for the task list
+
+        Returns:
+            A completed task
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        return await self.update_task(task_id, list_id, status='completed')
+
+    async def update_tasks(self, updates: list[tuple[str, str, dict[str, Any]]]) -> list[Task]:
+        '''Update the properties of several tasks using as few requests as possible
+
+        Args:
+            updates: Tuples of task identifier, task list identifier and task properties from `Task` object
+
+        Returns:
+            Updated tasks in the order of `updates`
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        items = [(AsyncToDoConnection._task_path(list_id, task_id), task_data) for task_id, list_id, task_data in updates]
+        contents = await self._batch('PATCH', items)
+
+        return [Task.from_dict(task_data) for task_data in contents]
+
+    async def complete_tasks(self, tasks: list[tuple[str, str]]) -> list[Task]:
+        '''Complete several tasks using as few requests as possible
+
+        Args:
+            tasks: Tuples of task identifier and task list identifier
+
+        Returns:
+            Completed tasks in the order of `tasks`
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        return await self.update_tasks([(task_id, list_id, {'status': 'completed'}) for task_id, list_id in tasks])
+
+    async def delete_tasks(self, tasks: list[tuple[str, str]]) -> bool:
+        '''Delete several tasks using as few requests as possible
+
+        Args:
+            tasks: Tuples of task identifier and task list identifier
+
+        Returns:
+            `True` if success
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        await self._batch('DELETE', [(AsyncToDoConnection._task_path(list_id, task_id), None) for task_id, list_id in tasks])
+
+        return True
@@ -1,17 +1,40 @@
 import dataclasses
+import functools
 import json
-import os
 import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Literal, TypedDict
+from typing import Any, ClassVar, Literal, TypedDict
+from urllib.parse import quote, urlencode
 from zoneinfo import ZoneInfo
 
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
 from .windows_zones_adapter import get_zoneinfo_name_by_windows_zone
 
 
+_loads: Callable[[bytes], Any]
+_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+@functools.cache
+def _zoneinfo(windows_zone: str) -> ZoneInfo:
+    return ZoneInfo(get_zoneinfo_name_by_windows_zone(windows_zone))
+
+
 class PymstodoError(Exception):
     '''Basic Pymstodo exception'''
 
@@ -19,6 +42,11 @@ class PymstodoError(Exception):
         super().__init__(f'Error {status_code}: {reason}')
 
 
+def _check(resp: Response) -> None:
+    if not resp.ok:
+        raise PymstodoError(resp.status_code, resp.reason)
+
+
 class Token(TypedDict):
     token_type: str
     scope: list[str]
@@ -89,7 +117,7 @@ class TaskStatusFilter(Enum):
     ALL = 'all'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskList:
     '''**To-Do task list** contains one or more task'''
 
@@ -107,9 +135,15 @@ class TaskList:
 
     wellknownListName: str
 
-    def __init__(self, **kwargs: Any) -> None:
-        for f in dataclasses.fields(self):
-            setattr(self, f.name, kwargs.get('id' if f.name == 'list_id' else f.name))
+    def __init__(self, data: dict[str, Any] | None = None, /, **kwargs: Any) -> None:
+        source = kwargs if data is None else data
+        for name, key in _TASK_LIST_KEYS:
+            setattr(self, name, source.get(key))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'TaskList':
+        '''Build a task list from a decoded API object without expanding it into keyword arguments'''
+        return cls(data)
 
     def __str__(self) -> str:
         return self.displayName.replace('|', '—').strip()
@@ -117,7 +151,7 @@ class TaskList:
     @property
     def link(self) -> str:
         '''Link to the task list on web.'''
-        return 'href=https://to-do.live.com/tasks/{self.list_id}'
+        return f'https://to-do.live.com/tasks/{self.list_id}'
 
     @property
     def wellknown_list_name(self) -> WellknownListName | None:
@@ -125,56 +159,62 @@ class TaskList:
         return None if self.wellknownListName == 'none' else WellknownListName(self.wellknownListName)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Task:
     '''**To-Do task** represents a task, such as a piece of work or personal item, that can be tracked and completed'''
 
     task_id: str
     '''Unique identifier for the task. By default, this value changes when the item is moved from one list to another'''
 
-    body: _Body
+    body: _Body | None
 
-    categories: list[str]
+    categories: list[str] | None
     '''The categories associated with the task'''
 
-    completedDateTime: _DateTimeTimeZone
+    completedDateTime: _DateTimeTimeZone | None
     '''The date and time in the specified time zone that the task was finished. Uses ISO 8601 format'''
 
-    createdDateTime: str
+    createdDateTime: str | None
     '''The date and time when the task was created. It is in UTC and uses ISO 8601 format'''
 
-    dueDateTime: _DateTimeTimeZone
+    dueDateTime: _DateTimeTimeZone | None
     '''The date and time in the specified time zone that the task is to be finished. Uses ISO 8601 format'''
 
-    hasAttachments: bool
+    hasAttachments: bool | None
     '''Indicates whether the task has attachments'''
 
-    title: str
+    title: str | None
     '''A brief description of the task'''
 
-    importance: Literal['low', 'normal', 'high']
+    importance: Literal['low', 'normal', 'high'] | None
     '''The importance of the task. Possible values are: `low`, `normal`, `high`'''
 
-    isReminderOn: bool
+    isReminderOn: bool | None
     '''Set to true if an alert is set to remind the user of the task'''
 
-    lastModifiedDateTime: str
+    lastModifiedDateTime: str | None
     '''The date and time when the task was last modified. It is in UTC and uses ISO 8601 format'''
 
-    reminderDateTime: _DateTimeTimeZone
+    reminderDateTime: _DateTimeTimeZone | None
     '''The date and time in the specified time zone for a reminder alert of the task to occur. Uses ISO 8601 format'''
 
-    startDateTime: _DateTimeTimeZone
+    startDateTime: _DateTimeTimeZone | None
     '''The date and time in the specified time zone at which the task is scheduled to start. Uses ISO 8601 format'''
 
-    status: str
+    status: str | None
 
-    def __init__(self, **kwargs: Any) -> None:
-        for f in dataclasses.fields(self):
-            setattr(self, f.name, kwargs.get('id' if f.name == 'task_id' else f.name))
+    def __init__(self, data: dict[str, Any] | None = None, /, **kwargs: Any) -> None:
+        source = kwargs if data is None else data
+        for name, key in _TASK_KEYS:
+            setattr(self, name, source.get(key))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'Task':
+        '''Build a task from a decoded API object without expanding it into keyword arguments'''
+        return cls(data)
 
     def __str__(self) -> str:
-        title = self.title.replace('|', '—').strip()
+        title = (self.title or '').replace('|', '—').strip()
         if self.due_date:
             title += f' • Due {self.due_date.strftime("%x")}'
 
@@ -191,7 +231,7 @@ class Task:
     def completed_date(self) -> datetime | None:
         '''The date and time in the specified time zone that the task was finished'''
         if self.completedDateTime:
-            return datetime.fromisoformat(self.completedDateTime['dateTime']).astimezone(ZoneInfo(get_zoneinfo_name_by_windows_zone(self.completedDateTime['timeZone'])))
+            return datetime.fromisoformat(self.completedDateTime['dateTime']).astimezone(_zoneinfo(self.completedDateTime['timeZone']))
         return None
 
     @property
@@ -205,7 +245,7 @@ class Task:
     def due_date(self) -> datetime | None:
         '''The date and time in the specified time zone that the task is to be finished'''
         if self.dueDateTime:
-            return datetime.fromisoformat(self.dueDateTime['dateTime']).astimezone(ZoneInfo(get_zoneinfo_name_by_windows_zone(self.dueDateTime['timeZone'])))
+            return datetime.fromisoformat(self.dueDateTime['dateTime']).astimezone(_zoneinfo(self.dueDateTime['timeZone']))
         return None
 
     @property
@@ -219,23 +259,148 @@ class Task:
     def reminder_date(self) -> datetime | None:
         '''The date and time in the specified time zone for a reminder alert of the task to occur'''
         if self.reminderDateTime:
-            return datetime.fromisoformat(self.reminderDateTime['dateTime']).astimezone(ZoneInfo(get_zoneinfo_name_by_windows_zone(self.reminderDateTime['timeZone'])))
+            return datetime.fromisoformat(self.reminderDateTime['dateTime']).astimezone(_zoneinfo(self.reminderDateTime['timeZone']))
         return None
 
     @property
     def start_date(self) -> datetime | None:
         '''The date and time in the specified time zone at which the task is scheduled to start'''
         if self.startDateTime:
-            return datetime.fromisoformat(self.startDateTime['dateTime']).astimezone(ZoneInfo(get_zoneinfo_name_by_windows_zone(self.startDateTime['timeZone'])))
+            return datetime.fromisoformat(self.startDateTime['dateTime']).astimezone(_zoneinfo(self.startDateTime['timeZone']))
         return None
 
     @property
-    def task_status(self) -> TaskStatus:
+    def task_status(self) -> TaskStatus | None:
         '''Indicates the state or progress of the task'''
-        return TaskStatus(self.status)
+        if self.status:
+            return TaskStatus(self.status)
+        return None
+
+
+def _api_keys(cls: type, id_field: str) -> tuple[tuple[str, str], ...]:
+    return tuple((f.name, 'id' if f.name == id_field else f.name) for f in dataclasses.fields(cls))
+
+
+_TASK_LIST_KEYS = _api_keys(TaskList, 'list_id')
+_TASK_KEYS = _api_keys(Task, 'task_id')
+
+
+class _Connection:
+    '''Settings and token handling shared by the synchronous and asynchronous connections'''
+    _redirect: ClassVar[str] = 'https://localhost/login/authorized'
+    _scope: ClassVar[str] = 'openid offline_access Tasks.ReadWrite'
+    _authority: ClassVar[str] = 'https://login.microsoftonline.com/common'
+    _authorize_endpoint: ClassVar[str] = '/oauth2/v2.0/authorize'
+    _token_endpoint: ClassVar[str] = '/oauth2/v2.0/token'
+    _graph_url: ClassVar[str] = 'https://graph.microsoft.com/v1.0'
+    _base_api_url: ClassVar[str] = f'{_graph_url}/me/todo/'
+    _batch_url: ClassVar[str] = f'{_graph_url}/$batch'
+    _batch_limit: ClassVar[int] = 20
+    _lists_url: ClassVar[str] = f'{_base_api_url}lists'
+    _list_url: ClassVar[Callable[..., str]] = f'{_lists_url}/{{}}'.format
+    _tasks_url: ClassVar[Callable[..., str]] = f'{_lists_url}/{{}}/tasks'.format
+    _task_url: ClassVar[Callable[..., str]] = f'{_lists_url}/{{}}/tasks/{{}}'.format
+    _task_path: ClassVar[Callable[..., str]] = '/me/todo/lists/{}/tasks/{}'.format
+    _token_check_interval: ClassVar[float] = 30
+    _json_headers: ClassVar[dict[str, str]] = {'Content-Type': 'application/json'}
+    _query_safe: ClassVar[str] = "$',"
+    _status_filters: ClassVar[dict[TaskStatusFilter, str]] = {
+        TaskStatusFilter.COMPLETED: '&' + urlencode({'$filter': "status eq 'completed'"}, safe=_query_safe, quote_via=quote),
+        TaskStatusFilter.NOT_COMPLETED: '&' + urlencode({'$filter': "status ne 'completed'"}, safe=_query_safe, quote_via=quote),
+        TaskStatusFilter.ALL: ''
+    }
+
+    _token: Token
+    _auth_header: str
+    _last_token_check: float
+
+    def __init__(self, client_id: str, client_secret: str, token: Token) -> None:
+        self.client_id: str = client_id
+        self.client_secret: str = client_secret
+        self.token = token
+        self._oauth_session: OAuth2Session = OAuth2Session(client_id, scope=_Connection._scope,
+                                                           token=token, redirect_uri=_Connection._redirect)
+
+    @property
+    def token(self) -> Token:
+        '''Token used for the requests, a newly assigned one is sent with the next request'''
+        return self._token
+
+    @token.setter
+    def token(self, token: Token) -> None:
+        self._token = token
+        self._auth_header = f'Bearer {token["access_token"]}'
+        # check the expiry of a replaced token on the next request
+        self._last_token_check = float('-inf')
+
+    def _token_expired(self) -> bool:
+        # the token is renewed 300 seconds before it expires, so checking it every 30 seconds is enough
+        now = time.monotonic()
+        if now - self._last_token_check < _Connection._token_check_interval:
+            return False
+        self._last_token_check = now
+        expire_time = self.token['expires_at'] - 300
+        return time.time() >= expire_time
 
+    def _renew_token(self) -> Token:
+        token_url = f'{_Connection._authority}{_Connection._token_endpoint}'
+        # `token` is public and may have been replaced since the last refresh
+        self._oauth_session.token = self.token
+        self.token = self._oauth_session.refresh_token(token_url, client_id=self.client_id, client_secret=self.client_secret)
+        return self.token
 
-class ToDoConnection:
+    @staticmethod
+    def _get_tasks_url(list_id: str, limit: int, status: TaskStatusFilter | None, fields: Iterable[str] | None) -> str:
+        filters = _Connection._status_filters
+        status_filter = filters.get(status or TaskStatusFilter.NOT_COMPLETED, filters[TaskStatusFilter.NOT_COMPLETED])
+        query = f'$top={limit}{status_filter}'
+        if isinstance(fields, str):
+            # a bare name would otherwise be joined letter by letter
+            fields = (fields,)
+        select = ','.join(fields) if fields is not None else ''
+        if select:
+            query += '&' + urlencode({'$select': select}, safe=_Connection._query_safe, quote_via=quote)
+        return f'{_Connection._tasks_url(list_id)}?{query}'
+
+    @staticmethod
+    def _batch_requests(method: str, items: Sequence[tuple[str, dict[str, Any] | None]]) -> list[list[dict[str, Any]]]:
+        batches = []
+        for start in range(0, len(items), _Connection._batch_limit):
+            batch_requests = []
+            for request_id, (path, body) in enumerate(items[start:start + _Connection._batch_limit]):
+                request: dict[str, Any] = {'id': str(request_id), 'method': method, 'url': path}
+                if body is not None:
+                    request['body'] = body
+                    request['headers'] = _Connection._json_headers
+                batch_requests.append(request)
+            batches.append(batch_requests)
+        return batches
+
+    @staticmethod
+    def _batch_results(responses: list[dict[str, Any]]) -> list[Any]:
+        results: list[Any] = []
+        for response in sorted(responses, key=lambda response: int(response['id'])):
+            body = response.get('body')
+            if response['status'] >= 400:
+                error = body.get('error') if isinstance(body, dict) else None
+                reason = error.get('message') if isinstance(error, dict) else None
+                raise PymstodoError(response['status'], reason or 'Batch request failed')
+            results.append(body)
+        return results
+
+    @staticmethod
+    def _new_task_data(title: str, due_date: datetime | None, body_text: str | None) -> dict[str, Any]:
+        task_data: dict[str, Any] = {'title': title}
+        if due_date:
+            # the wall-clock time is sent as is, like strftime did, so the offset is dropped before isoformat
+            date_time = due_date.replace(tzinfo=None).isoformat(timespec='seconds')
+            task_data['dueDateTime'] = {'dateTime': f'{date_time}.0000000', 'timeZone': 'UTC'}
+        if body_text:
+            task_data['body'] = {'content': body_text, 'contentType': 'text'}
+        return task_data
+
+
+class ToDoConnection(_Connection):
     '''**To-Do connection** is your entry point to the To-Do API
 
     Args:
@@ -243,17 +408,14 @@ class ToDoConnection:
         client_secret: API client secret
         token: Token obtained by method `get_token`
     '''
-    _redirect: str = 'https://localhost/login/authorized'
-    _scope: str = 'openid offline_access Tasks.ReadWrite'
-    _authority: str = 'https://login.microsoftonline.com/common'
-    _authorize_endpoint: str = '/oauth2/v2.0/authorize'
-    _token_endpoint: str = '/oauth2/v2.0/token'
-    _base_api_url: str = 'https://graph.microsoft.com/v1.0/me/todo/'
 
     def __init__(self, client_id: str, client_secret: str, token: Token) -> None:
-        self.client_id: str = client_id
-        self.client_secret: str = client_secret
-        self.token: Token = token
+        super().__init__(client_id, client_secret, token)
+        self._session: Session = Session()
+        self._session.headers['Authorization'] = self._auth_header
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
     @staticmethod
     def get_auth_url(client_id: str) -> Any:
@@ -280,14 +442,29 @@ class ToDoConnection:
         return oa_sess.fetch_token(token_url, client_secret=client_secret, authorization_response=redirect_resp)
 
     def _refresh_token(self) -> None:
-        now = time.time()
-        expire_time = self.token['expires_at'] - 300
-        if now >= expire_time:
-            token_url = f'{ToDoConnection._authority}{ToDoConnection._token_endpoint}'
-            oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope,
-                                    token=self.token, redirect_uri=ToDoConnection._redirect)
-            new_token = oa_sess.refresh_token(token_url, client_id=self.client_id, client_secret=self.client_secret)
-            self.token = new_token
+        if self._token_expired():
+            self._renew_token()
+        # follows both a renewal and a token assigned by the caller
+        self._session.headers['Authorization'] = self._auth_header
+
+    def _send_json(self, method: str, url: str, payload: Any) -> Response:
+        return self._session.request(method, url, data=_dumps(payload), headers=ToDoConnection._json_headers)
+
+    def _get_page(self, url: str) -> Any:
+        resp = self._session.get(url)
+        _check(resp)
+
+        return _loads(resp.content)
+
+    def _batch(self, method: str, items: Sequence[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        results: list[Any] = []
+        for batch_requests in ToDoConnection._batch_requests(method, items):
+            resp = self._send_json('POST', ToDoConnection._batch_url, {'requests': batch_requests})
+            _check(resp)
+
+            results.extend(ToDoConnection._batch_results(_loads(resp.content)['responses']))
+
+        return results
 
     def get_lists(self, limit: int | None = 99) -> list[TaskList]:
         '''Get a list of the task lists
@@ -302,13 +479,11 @@ class ToDoConnection:
             PymstodoError: An error occurred accessing the API
         '''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.get(f'{ToDoConnection._base_api_url}lists?$top={limit}')
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._session.get(f'{ToDoConnection._lists_url}?$top={limit}')
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())['value']
-        return [TaskList(**list_data) for list_data in contents]
+        contents = _loads(resp.content)['value']
+        return [TaskList.from_dict(list_data) for list_data in contents]
 
     def create_list(self, name: str) -> TaskList:
         '''Create a new task list
@@ -323,14 +498,12 @@ class ToDoConnection:
             PymstodoError: An error occurred accessing the API
         '''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.post(f'{ToDoConnection._base_api_url}lists', json={'displayName': name})
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._send_json('POST', ToDoConnection._lists_url, {'displayName': name})
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())
+        contents = _loads(resp.content)
 
-        return TaskList(**contents)
+        return TaskList.from_dict(contents)
 
     def get_list(self, list_id: str) -> TaskList:
         '''Read the properties of a task list
@@ -345,14 +518,12 @@ class ToDoConnection:
             PymstodoError: An error occurred accessing the API
         '''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.get(f'{ToDoConnection._base_api_url}lists/{list_id}')
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._session.get(ToDoConnection._list_url(list_id))
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())
+        contents = _loads(resp.content)
 
-        return TaskList(**contents)
+        return TaskList.from_dict(contents)
 
     def update_list(self, list_id: str, **list_data: str | bool) -> TaskList:
         '''Update the properties of a task list
@@ -367,14 +538,12 @@ class ToDoConnection:
         Raises:
             PymstodoError: An error occurred accessing the API'''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.patch(f'{ToDoConnection._base_api_url}lists/{list_id}', json=list_data)
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._send_json('PATCH', ToDoConnection._list_url(list_id), list_data)
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())
+        contents = _loads(resp.content)
 
-        return TaskList(**contents)
+        return TaskList.from_dict(contents)
 
     def delete_list(self, list_id: str) -> bool:
         '''Delete a task list
@@ -388,20 +557,20 @@ class ToDoConnection:
         Raises:
             PymstodoError: An error occurred accessing the API'''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.delete(f'{ToDoConnection._base_api_url}lists/{list_id}')
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._session.delete(ToDoConnection._list_url(list_id))
+        _check(resp)
 
         return True
 
-    def get_tasks(self, list_id: str, limit: int | None = 1000, status: TaskStatusFilter | None = TaskStatusFilter.NOT_COMPLETED) -> list[Task]:
+    def get_tasks(self, list_id: str, limit: int | None = 1000, status: TaskStatusFilter | None = TaskStatusFilter.NOT_COMPLETED, fields: Iterable[str] | None = None) -> list[Task]:
         '''Get tasks by a specified task list
 
         Args:
             list_id: Unique identifier for the task list
             limit: The limit size of the response
             status: The state or progress of the task
+            fields: Task properties to request, e.g. `('title', 'status', 'dueDateTime')` or a single `'title'`;
+                all properties if not set. Properties left out are `None` in the returned tasks
 
         Returns:
             Tasks of a specified task list
@@ -410,30 +579,24 @@ class ToDoConnection:
             PymstodoError: An error occurred accessing the API
         '''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        filters = {
-            TaskStatusFilter.COMPLETED: "filter=status eq 'completed'",
-            TaskStatusFilter.NOT_COMPLETED: "filter=status ne 'completed'",
-            TaskStatusFilter.ALL: None
-        }
         eff_limit = limit or 1000
-        params = (
-            filters.get(status or TaskStatusFilter.NOT_COMPLETED, filters[TaskStatusFilter.NOT_COMPLETED]),
-            f'top={eff_limit}'
-        )
-        params_str = '&$'.join(filter(None, params))
-        url = f'{ToDoConnection._base_api_url}lists/{list_id}/tasks?${params_str}'
-        contents: list[dict[str, Any]] = []
-        while (len(contents) < eff_limit or eff_limit <= 0) and url:
-            resp = oa_sess.get(url)
-            if not resp.ok:
-                raise PymstodoError(resp.status_code, resp.reason)
-            resp_content = json.loads(resp.content.decode())
-            url = resp_content.get('@odata.nextLink')
-            contents.extend(resp_content['value'])
-        if limit:
-            contents = contents[:limit]
-        return [Task(**task_data) for task_data in contents]
+        tasks: list[Task] = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = self._get_page(ToDoConnection._get_tasks_url(list_id, eff_limit, status, fields))
+            while True:
+                values = page['value']
+                next_url: str | None = page.get('@odata.nextLink')
+                # fetch the next page while the current one is being converted
+                next_page = None
+                if next_url and len(tasks) + len(values) < eff_limit:
+                    next_page = executor.submit(self._get_page, next_url)
+                tasks.extend(Task.from_dict(task_data) for task_data in values)
+                if next_page is None:
+                    break
+                page = next_page.result()
+        if limit and len(tasks) > limit:
+            del tasks[limit:]
+        return tasks
 
     def create_task(self, title: str, list_id: str, due_date: datetime | None = None, body_text: str | None = None) -> Task:
         '''Create a new task in a specified task list
@@ -450,19 +613,13 @@ class ToDoConnection:
         Raises:
             PymstodoError: An error occurred accessing the API'''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        task_data: dict[str, Any] = {'title': title}
-        if due_date:
-            task_data['dueDateTime'] = {'dateTime': due_date.strftime('%Y-%m-%dT%H:%M:%S.0000000'), 'timeZone': 'UTC'}
-        if body_text:
-            task_data['body'] = {'content': body_text, 'contentType': 'text'}
-        resp = oa_sess.post(f'{ToDoConnection._base_api_url}lists/{list_id}/tasks', json=task_data)
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        task_data = ToDoConnection._new_task_data(title, due_date, body_text)
+        resp = self._send_json('POST', ToDoConnection._tasks_url(list_id), task_data)
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())
+        contents = _loads(resp.content)
 
-        return Task(**contents)
+        return Task.from_dict(contents)
 
     def get_task(self, task_id: str, list_id: str) -> Task:
         '''Read the properties of a task
@@ -477,14 +634,12 @@ class ToDoConnection:
         Raises:
             PymstodoError: An error occurred accessing the API'''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.get(f'{ToDoConnection._base_api_url}lists/{list_id}/tasks/{task_id}')
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._session.get(ToDoConnection._task_url(list_id, task_id))
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())
+        contents = _loads(resp.content)
 
-        return Task(**contents)
+        return Task.from_dict(contents)
 
     def update_task(self, task_id: str, list_id: str, **task_data: str | int | bool) -> Task:
         '''Update the properties of a task
@@ -500,14 +655,12 @@ class ToDoConnection:
         Raises:
             PymstodoError: An error occurred accessing the API'''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.patch(f'{ToDoConnection._base_api_url}lists/{list_id}/tasks/{task_id}', json=task_data)
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._send_json('PATCH', ToDoConnection._task_url(list_id, task_id), task_data)
+        _check(resp)
 
-        contents = json.loads(resp.content.decode())
+        contents = _loads(resp.content)
 
-        return Task(**contents)
+        return Task.from_dict(contents)
 
     def delete_task(self, task_id: str, list_id: str) -> bool:
         '''Delete a task
@@ -522,10 +675,8 @@ class ToDoConnection:
         Raises:
             PymstodoError: An error occurred accessing the API'''
         self._refresh_token()
-        oa_sess = OAuth2Session(self.client_id, scope=ToDoConnection._scope, token=self.token)
-        resp = oa_sess.delete(f'{ToDoConnection._base_api_url}lists/{list_id}/tasks/{task_id}')
-        if not resp.ok:
-            raise PymstodoError(resp.status_code, resp.reason)
+        resp = self._session.delete(ToDoConnection._task_url(list_id, task_id))
+        _check(resp)
 
         return True
 
@@ -543,6 +694,48 @@ class ToDoConnection:
             PymstodoError: An error occurred accessing the API'''
         return self.update_task(task_id, list_id, status='completed')
 
+    def update_tasks(self, updates: list[tuple[str, str, dict[str, Any]]]) -> list[Task]:
+        '''Update the properties of several tasks using as few requests as possible
+
+        Args:
+            updates: Tuples of task identifier, task list identifier and task properties from `Task` object
+
+        Returns:
+            Updated tasks in the order of `updates`
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        self._refresh_token()
+        items = [(ToDoConnection._task_path(list_id, task_id), task_data) for task_id, list_id, task_data in updates]
+        contents = self._batch('PATCH', items)
+
+        return [Task.from_dict(task_data) for task_data in contents]
+
+    def complete_tasks(self, tasks: list[tuple[str, str]]) -> list[Task]:
+        '''Complete several tasks using as few requests as possible
 
-os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = '1'  # noqa: S105
-os.environ['OAUTHLIB_IGNORE_SCOPE_CHANGE'] = '1'
+        Args:
+            tasks: Tuples of task identifier and task list identifier
+
+        Returns:
+            Completed tasks in the order of `tasks`
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        return self.update_tasks([(task_id, list_id, {'status': 'completed'}) for task_id, list_id in tasks])
+
+    def delete_tasks(self, tasks: list[tuple[str, str]]) -> bool:
+        '''Delete several tasks using as few requests as possible
+
+        Args:
+            tasks: Tuples of task identifier and task list identifier
+
+        Returns:
+            `True` if success
+
+        Raises:
+            PymstodoError: An error occurred accessing the API'''
+        self._refresh_token()
+        self._batch('DELETE', [(ToDoConnection._task_path(list_id, task_id), None) for task_id, list_id in tasks])
+
+        return True
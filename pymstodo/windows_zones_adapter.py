@@ -1,5 +1,12 @@
-from .windows_zones_data import windows_zones
+import functools
+from collections.abc import Mapping
+
+
+@functools.cache
+def _windows_zones() -> Mapping[str, str]:
+    from .windows_zones_data import windows_zones
+    return windows_zones
 
 
 def get_zoneinfo_name_by_windows_zone(windows_zone: str) -> str:
-    return windows_zones.get(windows_zone, windows_zone)
+    return _windows_zones().get(windows_zone, windows_zone)
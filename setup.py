@@ -1,42 +1,17 @@
-from pathlib import Path
+import os
 
 import setuptools
 
 
-def long_description():
-    with Path('README.md').open(encoding='locale') as ld:
-        return ld.read()
+def find_ext_modules():
+    # opt-in native build of the client modules, requires mypy at build time;
+    # the async client is compiled too since interpreted classes cannot subclass the native _Connection
+    if os.environ.get('PYMSTODO_MYPYC') != '1':
+        return []
 
+    from mypyc.build import mypycify
+    return mypycify(['--ignore-missing-imports', 'pymstodo/client.py', 'pymstodo/async_client.py'])
 
-def find_requires():
-    with Path('requirements.txt').open(encoding='locale') as reqs:
-        return reqs.readlines()
 
-
-def find_version():
-    with Path('VERSION').open(encoding='locale') as ver:
-        return ver.readline().strip()
-
-
-setuptools.setup(
-    name='pymstodo',
-    version=find_version(),
-    author='Serhiy Shliapuhin',
-    author_email='shlyapugin@gmail.com',
-    description='Microsoft To Do API client',
-    long_description=long_description(),
-    long_description_content_type='text/markdown',
-    url='https://github.com/inbalboa/pymstodo',
-    packages=setuptools.find_packages(),
-    install_requires=find_requires(),
-    python_requires='>=3.10,<4.0',
-    classifiers=[
-        'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.10',
-        'Programming Language :: Python :: 3 :: Only',
-        'License :: OSI Approved',
-        'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
-        'Operating System :: OS Independent',
-    ],
-    license='GPLv3'
-)
+# the metadata lives in pyproject.toml, this file only hooks in the optional mypyc build
+setuptools.setup(ext_modules=find_ext_modules())
@@ -1,19 +1,102 @@
+import gzip
+import hashlib
+from http import HTTPStatus
 from pathlib import Path
-from urllib.request import urlopen
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
-from defusedxml import ElementTree
+from lxml import etree
 
 
 ZONES_XML_URL = 'https://raw.githubusercontent.com/unicode-org/cldr/main/common/supplemental/windowsZones.xml'
 OUTPUT_FILE = 'pymstodo/windows_zones_data.py'
+# bump whenever the layout of the generated module changes, so cached validators stop matching
+OUTPUT_FORMAT = 2
+ETAG_FILE = '.windows_zones.etag'
+DIGEST_FILE = '.windows_zones.blake2b'
 
-with urlopen(ZONES_XML_URL) as response:  # noqa: S310
-    zones_xml = ElementTree.parse(response)
 
-tz_data = {}
-for zone in zones_xml.getroot().find('.//windowsZones/mapTimezones'):
-    attrib = zone.attrib
-    if attrib['territory'] == '001':
-        tz_data[attrib['other']] = attrib['type']
+class _ZonesTarget:
+    '''Parser target that keeps the world-wide mapZone rows without building any elements'''
 
-Path(OUTPUT_FILE).write_text(f'windows_zones = {tz_data}\n', encoding='locale')
+    def __init__(self) -> None:
+        self.tz_data: dict[str, str] = {}
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag == 'mapZone' and attrib.get('territory') == '001':
+            self.tz_data[attrib['other']] = attrib['type']
+
+    def close(self) -> dict[str, str]:
+        return self.tz_data
+
+
+def extract_tz_map(document: bytes) -> dict[str, str]:
+    '''Map Windows time zone names to IANA ones from the downloaded document'''
+    # the hardening defusedxml used to provide, set directly on libxml2
+    parser = etree.XMLParser(target=_ZonesTarget(), resolve_entities=False, no_network=True, huge_tree=False)
+    parser.feed(document)
+
+    return parser.close()
+
+
+def read_cached(path: Path) -> str | None:
+    '''Value saved by a run that generated the current output format, if that output is still in place'''
+    if not (path.exists() and Path(OUTPUT_FILE).exists()):
+        return None
+    output_format, _, value = path.read_text(encoding='ascii').partition('\n')
+    return value.strip() if output_format == str(OUTPUT_FORMAT) else None
+
+
+def write_cached(path: Path, value: str) -> None:
+    path.write_text(f'{OUTPUT_FORMAT}\n{value}\n', encoding='ascii')
+
+
+def main() -> None:
+    # ask for the document only if it has changed since the last run
+    etag_path = Path(ETAG_FILE)
+    headers = {'Accept-Encoding': 'gzip'}
+    if etag := read_cached(etag_path):
+        headers['If-None-Match'] = etag
+    try:
+        response = urlopen(Request(ZONES_XML_URL, headers=headers))
+    except HTTPError as e:
+        if e.code != HTTPStatus.NOT_MODIFIED:
+            raise
+        print(f'{OUTPUT_FILE} is up to date')
+        return
+
+    with response:
+        # the document is repetitive enough to shrink about tenfold on the wire
+        gzipped = response.headers['Content-Encoding'] == 'gzip'
+        document = (gzip.GzipFile(fileobj=response) if gzipped else response).read()
+
+    # a server or mirror without ETag support still lets an unchanged document skip parsing
+    digest_path = Path(DIGEST_FILE)
+    digest = hashlib.blake2b(document, digest_size=16).hexdigest()
+    if read_cached(digest_path) == digest:
+        print(f'{OUTPUT_FILE} is up to date')
+        return
+
+    tz_data = extract_tz_map(document)
+
+    # one sorted entry per line keeps the generated module deterministic and diff-friendly
+    entries = ''.join(f'    {name!r}: {zone!r},\n' for name, zone in sorted(tz_data.items()))
+    # the read-only proxy stops callers from patching the shared table
+    module = f'from types import MappingProxyType\n\n\nwindows_zones = MappingProxyType({{\n{entries}}})\n'
+    # zone names are ASCII, so a strict encode fails loudly on an unexpected one whatever the locale is
+    content = module.encode('ascii')
+    output_path = Path(OUTPUT_FILE)
+    if output_path.exists() and output_path.read_bytes() == content:
+        print(f'{OUTPUT_FILE} is up to date')
+    else:
+        # swapped in with one rename so an interrupted run never leaves the module half written
+        tmp_path = Path(f'{OUTPUT_FILE}.tmp')
+        tmp_path.write_bytes(content)
+        tmp_path.replace(output_path)
+    write_cached(digest_path, digest)
+    if etag := response.headers['ETag']:
+        write_cached(etag_path, etag)
+
+
+if __name__ == '__main__':
+    main()